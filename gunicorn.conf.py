@@ -0,0 +1,15 @@
+"""Gunicorn configuration for the ISS Tracker API."""
+
+bind = "0.0.0.0:5000"
+workers = 4
+worker_class = "gthread"
+threads = 8
+
+
+def post_worker_init(worker):
+    """Warm the trajectory cache in the background as each worker starts."""
+    import threading
+
+    from iss_tracker import get_iss_data
+
+    threading.Thread(target=get_iss_data, daemon=True).start()
@@ -1,13 +1,19 @@
-from flask import Flask, jsonify, request
+from flask import Flask, Response, request
 import requests
-import xmltodict
+import io
 import math
+import re
+import threading
+import time
 import logging
 import redis
-import json
+import orjson
+import numpy as np
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
 from geopy.geocoders import Nominatim
+from numba import njit
+from lxml import etree
 
 
 app = Flask(__name__)
@@ -18,58 +24,221 @@ logger = logging.getLogger(__name__)
 REDIS_HOST = "redis"
 REDIS_PORT = 6379
 REDIS_KEY = "iss_data"
+REDIS_INDEX_KEY = "iss_epoch_index"
 
-# Connect to Redis
+# Cached trajectory data counts as fresh for 4 hours, tracked by a sentinel
+# key ("iss_fresh"); the data itself is kept past that so a refresh that gets
+# a 304 from NASA can reuse it instead of re-downloading
+CACHE_TTL = 14400
 
-r = redis.Redis(host=REDIS_HOST, port=REDIS_PORT, decode_responses=True)
+# Reverse-geocode results barely change, keep them for a day
+GEO_CACHE_TTL = 86400
+
+# State vector components stored as raw float64 arrays (SoA layout)
+COMPONENTS = ('x', 'y', 'z', 'x_dot', 'y_dot', 'z_dot')
+
+# Fixed-width 'YYYY-DDDTHH:MM:SS' epoch format, compiled once so validation
+# and field extraction happen in a single C-level match
+_EPOCH_RE = re.compile(r'^(\d{4})-(\d{3})T(\d{2}):(\d{2}):(\d{2})')
+
+# Connect to Redis. Replies stay as bytes: orjson and np.frombuffer consume
+# them directly, so an up-front UTF-8 decode of every payload is wasted work
+
+r = redis.Redis(host=REDIS_HOST, port=REDIS_PORT)
 
 # ISS Data Sources
 ISS_TRAJECTORY_URL = "https://nasa-public-data.s3.amazonaws.com/iss-coords/current/ISS_OEM/ISS.OEM_J2K_EPH.xml"
 ISS_NOW_URL = "http://api.open-notify.org/iss-now.json"
 
+# One geocoder for the process so its HTTP session gets reused
+geolocator = Nominatim(user_agent="iss_tracker")
+
+# Shared HTTP session: keep-alive avoids a fresh TCP+TLS handshake per call
+http = requests.Session()
+
+# Serialize cold-cache fetches so concurrent misses don't all download the file
+_fetch_lock = threading.Lock()
+
+# How long one worker may hold the cross-process download lock before the
+# waiters give up on it and fetch themselves
+FETCH_LOCK_TTL = 120
+
+# Per-process memo of the parsed record list: skips the Redis round-trip and
+# full deserialize between requests; the iss_ver counter keeps it coherent
+MEMO_TTL = 60
+_data_cache = {'time': 0.0, 'version': None, 'data': None}
+
 def fetch_iss_data() -> List[Dict[str, Any]]:
     """
     Fetch ISS data from the NASA API and store it in Redis
 
+    Only one thread downloads at a time, and a Redis lock extends the same
+    guarantee across gunicorn workers; waiters reuse whatever the winner
+    just cached
+
     There is no input arguments
 
     Returns:
         iss_data (List[Dict[str, Any]]): List of dictionaries, each containing
         time and state vectors (this is a global variable so it can be used throughout)
     """
+    with _fetch_lock:
+        cached = _cached_records()
+        if cached:
+            logger.info("Cache was refreshed while waiting for the fetch lock.")
+            return cached
+
+        # Cross-process guard: the first worker downloads, the rest poll for
+        # its result and only fetch themselves if it never lands
+        try:
+            acquired = r.set("iss_fetch_lock", 1, nx=True, ex=FETCH_LOCK_TTL)
+        except redis.RedisError:
+            acquired = True
+        if not acquired:
+            deadline = time.monotonic() + FETCH_LOCK_TTL
+            while time.monotonic() < deadline:
+                time.sleep(1)
+                cached = _cached_records()
+                if cached:
+                    logger.info("Another worker refreshed the cache.")
+                    return cached
+
+        try:
+            return _fetch_iss_data()
+        finally:
+            if acquired:
+                try:
+                    r.delete("iss_fetch_lock")
+                except redis.RedisError:
+                    pass
+
+
+def _cached_records() -> List[Dict[str, Any]]:
+    """
+    Returns the cached record list if present and fresh, else an empty list
+
+    There is no input arguments
+
+    Returns:
+        iss_data (List[Dict[str, Any]]): Parsed state vector records, or []
+        when the cache is cold, stale, or unreachable
+    """
+    try:
+        items = r.lrange(REDIS_KEY, 0, -1)
+        if items and r.exists("iss_fresh"):
+            return [orjson.loads(item) for item in items]
+    except redis.RedisError:
+        pass
+    return []
+
+
+def _fetch_iss_data() -> List[Dict[str, Any]]:
+    """
+    Does the actual download, parse, and cache fill for fetch_iss_data
+
+    There is no input arguments
+
+    Returns:
+        iss_data (List[Dict[str, Any]]): List of dictionaries, each containing
+        time and state vectors
+    """
     try:
         logger.info("Fetching ISS data from NASA API...")
-        response = requests.get(ISS_TRAJECTORY_URL, timeout=10)
+
+        # Conditional GET: skip the ~15MB download when NASA's file is
+        # unchanged. Only send validators while we still hold data that a
+        # 304 could reuse; an empty cache needs the full download anyway
+        headers = {}
+        if r.exists(REDIS_KEY):
+            etag = r.get("iss_etag")
+            last_modified = r.get("iss_last_modified")
+            if etag:
+                headers['If-None-Match'] = etag.decode()
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified.decode()
+
+        response = http.get(ISS_TRAJECTORY_URL, timeout=10, headers=headers)
         logger.info(f"Response status code: {response.status_code}")
 
+        if response.status_code == 304:
+            items = r.lrange(REDIS_KEY, 0, -1)
+            if items:
+                logger.info("NASA data unchanged (304), renewing freshness window.")
+                r.set("iss_fresh", 1, ex=CACHE_TTL)
+                return [orjson.loads(item) for item in items]
+            # Data vanished between the exists check and now; fetch in full
+            response = http.get(ISS_TRAJECTORY_URL, timeout=10)
+
         response.raise_for_status()
         logger.info("Successfully fetched ISS data.")
 
-        data = xmltodict.parse(response.text)
-        state_vectors = data.get('ndm', {}).get('oem', {}).get('body', {}).get('segment', {}).get('data', {}).get('stateVector', [])
-        #state_vectors = data['ndm']['oem']['body']['segment']['data']['stateVector']
-        #if not isinstance(state_vectors, list):
-        #    state_vectors = [state_vectors]
-
-        if not state_vectors:
+        # Stream stateVector elements instead of building a dict of the whole
+        # ~15MB file, freeing each element once its fields are extracted.
+        # Fields stay as text here; numpy converts each column in one C pass
+        epochs = []
+        rows = {name: [] for name in COMPONENTS}
+        context = etree.iterparse(io.BytesIO(response.content), tag='stateVector')
+        for _, element in context:
+            epochs.append(element.findtext('EPOCH'))
+            for name in COMPONENTS:
+                rows[name].append(element.findtext(name.upper()))
+            element.clear()
+            while element.getprevious() is not None:
+                del element.getparent()[0]
+
+        if not epochs:
             logger.error("NASA API returned no state vectors!")
             return []
 
+        # One fromiter call per component writes straight into a contiguous
+        # float64 buffer, replacing 6N Python-level float() calls
+        arrays = {
+            name: np.fromiter(rows[name], dtype=np.float64, count=len(epochs))
+            for name in COMPONENTS
+        }
+
         iss_data = [
-            {
-                'epoch': state['EPOCH'],
-                'x': float(state['X']['#text']),
-                'y': float(state['Y']['#text']),
-                'z': float(state['Z']['#text']),
-                'x_dot': float(state['X_DOT']['#text']),
-                'y_dot': float(state['Y_DOT']['#text']),
-                'z_dot': float(state['Z_DOT']['#text']),
-            }
-            for state in state_vectors
+            {'epoch': epoch, **{name: float(arrays[name][i]) for name in COMPONENTS}}
+            for i, epoch in enumerate(epochs)
         ]
 
-        # Store data in Redis
-        r.set(REDIS_KEY, json.dumps(iss_data, indent=4))
+        # Store records as a Redis list (one JSON blob per state vector) so
+        # paginated reads only deserialize the requested slice, plus an
+        # epoch -> index map for O(1) lookups
+        epoch_index = {state['epoch']: i for i, state in enumerate(iss_data)}
+        pipe = r.pipeline()
+        pipe.delete(REDIS_KEY)
+        for state in iss_data:
+            pipe.rpush(REDIS_KEY, orjson.dumps(state))
+        pipe.execute()
+        r.set(REDIS_INDEX_KEY, orjson.dumps(epoch_index))
+
+        # Remember the response validators for the next conditional GET
+        if response.headers.get('ETag'):
+            r.set("iss_etag", response.headers['ETag'])
+        if response.headers.get('Last-Modified'):
+            r.set("iss_last_modified", response.headers['Last-Modified'])
+
+        # Store each component as a raw float64 array for vectorized math
+        for name in COMPONENTS:
+            r.set(f"iss_{name}", arrays[name].tobytes())
+
+        # Speeds never change for a given trajectory, compute them once here
+        speeds = np.sqrt(arrays['x_dot']**2 + arrays['y_dot']**2 + arrays['z_dot']**2)
+        r.set("iss_speeds", speeds.tobytes())
+
+        # Parse every epoch to POSIX seconds once, for vectorized time lookups
+        epoch_seconds = np.fromiter(
+            (epoch_to_posix(epoch) for epoch in epochs),
+            dtype=np.float64, count=len(epochs)
+        )
+        r.set("iss_epoch_seconds", epoch_seconds.tobytes())
+
+        # Bump the version so per-process memos of the old data expire, and
+        # start a new freshness window
+        r.incr("iss_ver")
+        r.set("iss_fresh", 1, ex=CACHE_TTL)
+
         logger.info(f"Loaded {len(iss_data)} state vectors into Redis.")
         return iss_data
     except Exception as e:
@@ -81,18 +250,107 @@ def get_iss_data() -> List[Dict[str, Any]]:
     """
     Retrieves ISS data from Redis, or fetch from NASA if missing
 
+    Recent results are memoized in-process for MEMO_TTL seconds and dropped
+    whenever the iss_ver counter moves
+
     There is no input arguments
 
     Returns:
         iss_data (List[Dict[str, Any]]): List of dictionaries, each containing
         time and state vectors (this is a global variable so it can be used throughout)
     """
-    data = r.get(REDIS_KEY)
-    if data:
+    version = r.get("iss_ver")
+    now = time.monotonic()
+    if (_data_cache['data'] is not None and version is not None
+            and version == _data_cache['version']
+            and now - _data_cache['time'] < MEMO_TTL):
+        return _data_cache['data']
+
+    items = r.lrange(REDIS_KEY, 0, -1)
+    if items and r.exists("iss_fresh"):
         logger.info("ISS data loaded from Redis.")
-        return json.loads(data)
-    logger.info("No ISS data found in Redis, fetching from NASA")
-    return fetch_iss_data()
+        data = [orjson.loads(item) for item in items]
+    else:
+        logger.info("ISS data missing or stale, fetching from NASA")
+        data = fetch_iss_data()
+        version = r.get("iss_ver")
+
+    if data:
+        _data_cache['time'] = now
+        _data_cache['version'] = version
+        _data_cache['data'] = data
+    return data
+
+
+def get_epoch_index() -> Dict[str, int]:
+    """
+    Retrieves the epoch -> index map from Redis, or fetch from NASA if missing
+
+    There is no input arguments
+
+    Returns:
+        epoch_index (Dict[str, int]): Mapping of epoch string to its position
+        in the ISS data list
+    """
+    index = r.get(REDIS_INDEX_KEY)
+    if index and r.exists("iss_fresh"):
+        return orjson.loads(index)
+    logger.info("Epoch index missing or stale, fetching from NASA")
+    data = fetch_iss_data()
+    return {state['epoch']: i for i, state in enumerate(data)}
+
+
+def get_iss_arrays() -> Dict[str, np.ndarray]:
+    """
+    Retrieves the SoA component arrays from Redis, or fetch from NASA if missing
+
+    There is no input arguments
+
+    Returns:
+        arrays (Dict[str, np.ndarray]): float64 array per state vector
+        component (x, y, z, x_dot, y_dot, z_dot), zero-copy from Redis bytes
+    """
+    raw = {name: r.get(f"iss_{name}") for name in COMPONENTS}
+    if all(buf is not None for buf in raw.values()) and r.exists("iss_fresh"):
+        return {name: np.frombuffer(buf, dtype=np.float64) for name, buf in raw.items()}
+    logger.info("Component arrays missing or stale, fetching from NASA")
+    data = fetch_iss_data()
+    return {
+        name: np.fromiter((state[name] for state in data), dtype=np.float64, count=len(data))
+        for name in COMPONENTS
+    }
+
+
+def get_epoch_seconds() -> np.ndarray:
+    """
+    Retrieves the precomputed POSIX timestamps from Redis, or fetch if missing
+
+    There is no input arguments
+
+    Returns:
+        epoch_seconds (np.ndarray): float64 array of POSIX timestamps, one
+        per epoch, in the same order as the ISS data list
+    """
+    raw = r.get("iss_epoch_seconds")
+    if raw is not None and r.exists("iss_fresh"):
+        return np.frombuffer(raw, dtype=np.float64)
+    logger.info("Epoch seconds missing or stale, fetching from NASA")
+    data = fetch_iss_data()
+    return np.fromiter((epoch_to_posix(state['epoch']) for state in data),
+                       dtype=np.float64, count=len(data))
+
+def json_response(obj: Any) -> Response:
+    """
+    Serializes an object straight to a JSON response with orjson
+
+    Args:
+        obj (Any): JSON-serializable object
+
+    Returns:
+        response (Response): application/json response built from orjson bytes
+    """
+    return Response(orjson.dumps(obj), mimetype='application/json')
+
 
 def calculate_speed(x_dot: float, y_dot: float, z_dot: float) -> float:
     """
@@ -113,6 +371,50 @@ def calculate_speed(x_dot: float, y_dot: float, z_dot: float) -> float:
         logger.error(f"Invalid Velocity Components: x_dot={x_dot}, y_dot={y_dot}, z_dot={z_dot}. Error: {e}")
         raise
 
+def get_all_speeds() -> np.ndarray:
+    """
+    Retrieves the precomputed speeds from Redis, or recompute if missing
+
+    There is no input arguments
+
+    Returns:
+        speeds (np.ndarray): float64 array of speeds (km/s), one per epoch,
+        in the same order as the ISS data list
+    """
+    raw = r.get("iss_speeds")
+    if raw is not None and r.exists("iss_fresh"):
+        return np.frombuffer(raw, dtype=np.float64)
+    logger.info("Speeds missing or stale, recomputing from component arrays")
+    arrays = get_iss_arrays()
+    return np.sqrt(arrays['x_dot']**2 + arrays['y_dot']**2 + arrays['z_dot']**2)
+
+
+@njit('float64(unicode_type)', cache=True)
+def epoch_to_posix(epoch_str: str) -> float:
+    """
+    Converts epoch string to POSIX timestamp (compiled with Numba)
+
+    Args:
+        epoch_str (str): Epoch timestamp string formatted as 'YYYY-DDDTHH:MM:SS.000Z'
+
+    Returns:
+        posix (float): Seconds since 1970-01-01 UTC
+    """
+    year = ((ord(epoch_str[0]) - 48) * 1000 + (ord(epoch_str[1]) - 48) * 100
+            + (ord(epoch_str[2]) - 48) * 10 + (ord(epoch_str[3]) - 48))
+    day = ((ord(epoch_str[5]) - 48) * 100 + (ord(epoch_str[6]) - 48) * 10
+           + (ord(epoch_str[7]) - 48))
+    hour = (ord(epoch_str[9]) - 48) * 10 + (ord(epoch_str[10]) - 48)
+    minute = (ord(epoch_str[12]) - 48) * 10 + (ord(epoch_str[13]) - 48)
+    second = (ord(epoch_str[15]) - 48) * 10 + (ord(epoch_str[16]) - 48)
+
+    # Days from 1970-01-01 to Jan 1 of `year` via the Gregorian leap rule,
+    # then offset by the day-of-year
+    y = year - 1
+    days = year * 365 + y // 4 - y // 100 + y // 400 - 719528 + day
+    return days * 86400.0 + hour * 3600.0 + minute * 60.0 + second
+
+
 def epoch_to_datetime(epoch_str: str) -> datetime:
     """
     Converts epoch string to datetime object
@@ -123,14 +425,12 @@ def epoch_to_datetime(epoch_str: str) -> datetime:
     Returns:
         data (datetime): Parsed datetime object
     """
+    match = _EPOCH_RE.match(epoch_str)
+    if match is None:
+        logger.error(f"Error parsing epoch: {epoch_str}")
+        raise ValueError(f"Invalid epoch format: {epoch_str}")
     try:
-        year, day, hour, minute, second = (
-            int(epoch_str[:4]),
-            int(epoch_str[5:8]),
-            int(epoch_str[9:11]),
-            int(epoch_str[12:14]),
-            int(epoch_str[15:17])
-        )
+        year, day, hour, minute, second = map(int, match.groups())
         date = datetime(year, 1, 1) + timedelta(days=day - 1, hours=hour, minutes=minute, seconds=second)
         return date
     except ValueError as e:
@@ -149,84 +449,146 @@ def find_closest_epoch(data: List[Dict[str, Any]], target_time: datetime) -> Dic
     Returns:
         closest_state (Dict[str, Any]): State Vector with epoch closest to target time
     """
-    closest_state = min(data, key=lambda state: abs((epoch_to_datetime(state['epoch']) - target_time).total_seconds()))
-    return closest_state
+    target = (target_time - datetime(1970, 1, 1)).total_seconds()
+    epoch_seconds = np.fromiter(
+        (epoch_to_posix(state['epoch']) for state in data),
+        dtype=np.float64, count=len(data)
+    )
+    idx = int(np.argmin(np.abs(epoch_seconds - target)))
+    return data[idx]
 
 def get_geolocation(lat: float, lon: float) -> str:
     """Return the approximate geographical location for given latitude & longitude."""
-    geolocator = Nominatim(user_agent="iss_tracker")
+    # 0.1 degree (~11km) buckets are plenty of resolution for the ISS
+    cache_key = f"geo:{lat:.1f}:{lon:.1f}"
+    try:
+        cached = r.get(cache_key)
+        if cached:
+            return cached.decode()
+    except redis.RedisError as e:
+        logger.warning(f"Geolocation cache unavailable: {e}")
+
     try:
         location = geolocator.reverse((lat, lon), exactly_one=True)
-        return location.address if location else "Unknown Location"
+        address = location.address if location else "Unknown Location"
     except Exception as e:
         logger.error(f"Error fetching geolocation: {e}")
         return "Unknown Location"
 
+    try:
+        r.set(cache_key, address, ex=GEO_CACHE_TTL)
+    except redis.RedisError:
+        pass
+    return address
+
 @app.route('/epochs', methods=['GET'])
 def get_epochs():
     """
     Return all epochs with optional limit and offset query parameter
     """
-    data = get_iss_data()
     limit = request.args.get('limit', default=None, type=int)
     offset = request.args.get('offset', default=0, type=int)
-    result = data[offset:offset + limit] if limit else data[offset:]
-    return jsonify(result)
+
+    # Only a missing or stale cache refetches; an empty slice from a warm
+    # cache just means the offset is past the end and legitimately yields []
+    if not r.exists(REDIS_KEY) or not r.exists("iss_fresh"):
+        data = fetch_iss_data()
+        result = data[offset:offset + limit] if limit else data[offset:]
+        return json_response(result)
+
+    # LRANGE pulls just the requested slice, so only those items get parsed
+    end = offset + limit - 1 if limit else -1
+    items = r.lrange(REDIS_KEY, offset, end)
+    # The cached items are already JSON; join them instead of re-serializing
+    return Response(b'[' + b','.join(items) + b']', mimetype='application/json')
+
+@app.route('/epochs/closest', methods=['GET'])
+def get_closest_epoch():
+    """
+    Return the state vector closest to a target time
+
+    The t query parameter accepts a POSIX timestamp or an epoch string in
+    the trajectory's 'YYYY-DDDTHH:MM:SS' format
+    """
+    t = request.args.get('t')
+    if t is None:
+        return json_response({'error': "Missing required query parameter 't'"}), 400
+    try:
+        target = float(t)
+    except ValueError:
+        try:
+            target = (epoch_to_datetime(t) - datetime(1970, 1, 1)).total_seconds()
+        except ValueError:
+            return json_response({'error': f'Invalid time format: {t}'}), 400
+
+    epoch_seconds = get_epoch_seconds()
+    if epoch_seconds.size == 0:
+        return json_response({'error': 'No ISS data available'}), 500
+
+    # OEM state vectors are time-ordered, so binary search the timestamps and
+    # compare the two bracketing neighbors
+    i = int(np.searchsorted(epoch_seconds, target))
+    candidates = np.clip([i - 1, i], 0, epoch_seconds.size - 1)
+    best = int(candidates[np.argmin(np.abs(epoch_seconds[candidates] - target))])
+
+    # The stored record is already JSON, pass it through untouched
+    item = r.lindex(REDIS_KEY, best)
+    if item is not None:
+        return Response(item, mimetype='application/json')
+    data = get_iss_data()
+    if not data:
+        return json_response({'error': 'No ISS data available'}), 500
+    return json_response(data[best])
 
 @app.route('/epochs/<epoch>', methods=['GET'])
 def get_epoch(epoch: str):
     """
     Return the state vector for a specific epoch
     """
-    data = get_iss_data()
-    for state in data:
-        if state['epoch'] == epoch:
-            return jsonify(state)
-    return jsonify({'error': 'Epoch not found'}), 404
+    idx = get_epoch_index().get(epoch)
+    if idx is None:
+        return json_response({'error': 'Epoch not found'}), 404
+    arrays = get_iss_arrays()
+    state = {'epoch': epoch, **{name: float(arrays[name][idx]) for name in COMPONENTS}}
+    return json_response(state)
 
 @app.route('/epochs/<epoch>/speed', methods=['GET'])
 def get_epoch_speed(epoch: str):
     """
     Return the instantaneous speed for a specific epoch
     """
-    data = get_iss_data()
-    for state in data:
-        if state['epoch'] == epoch:
-            speed = calculate_speed(state['x_dot'], state['y_dot'], state['z_dot'])
-            return jsonify({'epoch': epoch, 'speed_km_s': speed})
-    return jsonify({'error': 'Epoch not found'}), 404
+    idx = get_epoch_index().get(epoch)
+    if idx is None:
+        return json_response({'error': 'Epoch not found'}), 404
+    speed = float(get_all_speeds()[idx])
+    return json_response({'epoch': epoch, 'speed_km_s': speed})
 
 @app.route('/epochs/<epoch>/location', methods=['GET'])
 def get_epoch_location(epoch: str):
     """Return latitude, longitude, altitude, and geoposition for a specific epoch."""
     logger.info(f"Fetching location data for epoch: {epoch}")
-    data = get_iss_data()
+    idx = get_epoch_index().get(epoch)
+    if idx is None:
+        logger.error(f"Epoch not found: {epoch}")
+        return json_response({'error': 'Epoch not found'}), 404
 
-    if not data:
+    arrays = get_iss_arrays()
+    if not all(len(arr) for arr in arrays.values()):
         logger.error("No ISS data found in Redis!")
-        return jsonify({'error': 'No ISS data available'}), 500
-
-    for state in data:
-        if state['epoch'] == epoch:
-            lat = state['y']
-            lon = state['x']
-            altitude = state['z']
+        return json_response({'error': 'No ISS data available'}), 500
 
-            # Check if latitude & longitude exist
-            if lat is None or lon is None or altitude is None:
-                logger.error(f"Missing data for epoch: {epoch}")
-                return jsonify({'error': f'Missing data for epoch {epoch}'}), 500
+    lat = float(arrays['y'][idx])
+    lon = float(arrays['x'][idx])
+    altitude = float(arrays['z'][idx])
 
-            geolocation = get_geolocation(lat, lon)
-            return jsonify({
-                'epoch': epoch,
-                'latitude': lat,
-                'longitude': lon,
-                'altitude_km': altitude,
-                'geoposition': geolocation
-            })
-    logger.error(f"Epoch not found: {epoch}")
-    return jsonify({'error': 'Epoch not found'}), 404
+    geolocation = get_geolocation(lat, lon)
+    return json_response({
+        'epoch': epoch,
+        'latitude': lat,
+        'longitude': lon,
+        'altitude_km': altitude,
+        'geoposition': geolocation
+    })
 
 @app.route('/now', methods=['GET'])
 def get_current_state():
@@ -234,7 +596,7 @@ def get_current_state():
     Return the state vector closest to the current time
     """
     try:
-        response = requests.get(ISS_NOW_URL, timeout=10)
+        response = http.get(ISS_NOW_URL, timeout=10)
         response.raise_for_status()
         data = response.json()
 
@@ -246,25 +608,23 @@ def get_current_state():
             lon = float(position["longitude"])
             geolocation = get_geolocation(lat, lon)
 
-            return jsonify({
+            return json_response({
                 "timestamp": timestamp,
                 "latitude": lat,
                 "longitude": lon,
                 "geoposition": geolocation
             }), 200
         else:
-            return jsonify({"error": "Invalid response format"}), 500
+            return json_response({"error": "Invalid response format"}), 500
     except requests.RequestException as e:
         logger.error(f"Error fetching ISS position: {e}")
-        return jsonify({"error": "Failed to retrieve real-time ISS position"}), 500
+        return json_response({"error": "Failed to retrieve real-time ISS position"}), 500
 
 if __name__ == '__main__':
-    # Ensure data is loaded into Redis on startup
     logger.info("Starting ISS Tracker")
-    
-    # Ensure data is loaded into Redis on startup
-    data = get_iss_data()
-    if not data:
-        logger.error("No data loaded into Redis on startup!")
+
+    # Warm the cache off the main thread so the server can bind immediately;
+    # early requests that miss will fetch themselves, gated by the lock
+    threading.Thread(target=get_iss_data, daemon=True).start()
 
     app.run(debug=True, host='0.0.0.0', port=5000)
@@ -1,12 +1,12 @@
 import pytest
-import requests
 import json
-from datetime import datetime
+from datetime import datetime, timezone
 from unittest.mock import patch, MagicMock
 from iss_tracker import (
     get_iss_data,
     calculate_speed,
     epoch_to_datetime,
+    epoch_to_posix,
     find_closest_epoch,
     get_geolocation,
     app
@@ -32,6 +32,13 @@ def test_epoch_to_datetime():
     with pytest.raises(ValueError):
         epoch_to_datetime("Invalid Format")
 
+def test_epoch_to_posix():
+    """Test compiled epoch string to POSIX timestamp conversion."""
+    assert epoch_to_posix("1970-001T00:00:00.000Z") == 0.0
+    assert epoch_to_posix("2025-069T12:00:00.000Z") == datetime(2025, 3, 10, 12, 0, 0, tzinfo=timezone.utc).timestamp()
+    # Day 366 of a leap year
+    assert epoch_to_posix("2024-366T23:59:59.000Z") == datetime(2024, 12, 31, 23, 59, 59, tzinfo=timezone.utc).timestamp()
+
 def test_find_closest_epoch():
     """Test finding the closest state vector."""
     sample_data = [
@@ -47,6 +54,9 @@ def test_get_iss_data(monkeypatch):
     class MockResponse:
         def __init__(self, text):
             self.text = text
+            self.content = text.encode()
+            self.status_code = 200
+            self.headers = {}
 
         def raise_for_status(self):
             pass
@@ -66,7 +76,7 @@ def test_get_iss_data(monkeypatch):
     def mock_get(*args, **kwargs):
         return MockResponse(mock_xml)
 
-    monkeypatch.setattr(requests, "get", mock_get)
+    monkeypatch.setattr("iss_tracker.http.get", mock_get)
     data = get_iss_data()
     assert data is not None, "get_iss_data returned None"
     assert len(data) >= 1, f"Expected at least 1 state vector, but got {len(data)}"
@@ -74,10 +84,9 @@ def test_get_iss_data(monkeypatch):
 
 def test_get_geolocation():
     """Test geolocation retrieval with mocking."""
-    with patch("iss_tracker.Nominatim") as mock_geolocator:
-        mock_instance = mock_geolocator.return_value
-        mock_instance.reverse.return_value.address = "Austin, TX, USA"
-        
+    with patch("iss_tracker.geolocator") as mock_geolocator:
+        mock_geolocator.reverse.return_value.address = "Austin, TX, USA"
+
         result = get_geolocation(30.2672, -97.7431)
         assert result == "Austin, TX, USA"
 
@@ -92,5 +101,11 @@ def test_flask_routes(client):
     response = client.get("/epochs/2025-069T12:00:00.000Z/speed")
     assert response.status_code in [200, 404]
     
+    response = client.get("/epochs/closest")
+    assert response.status_code == 400
+
+    response = client.get("/epochs/closest?t=not-a-time")
+    assert response.status_code == 400
+
     response = client.get("/now")
     assert response.status_code == 200